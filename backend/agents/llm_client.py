@@ -3,7 +3,12 @@ LLM Client using OpenAI SDK
 Configured for OpenRouter with agent-specific models from environment
 """
 
+import hashlib
+import json
 import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
 from typing import Optional
 import asyncio
 from openai import AsyncOpenAI
@@ -11,6 +16,36 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Response cache for effectively-deterministic prompts (opt-in via
+# AICOE_LLM_CACHE=1 or the cache_responses flag). Low-temperature calls
+# like connection checks repeat verbatim across test runs; serving them
+# from cache costs no tokens and microseconds instead of a round-trip.
+_CACHE_DIR = Path(os.getenv("AICOE_LLM_CACHE_DIR", "/tmp/aicoe_llm_cache"))
+_CACHE_TEMPERATURE_MAX = 0.3
+_CACHE_MAX_ENTRIES = 512
+
+_OPENROUTER_BASE_URL = "https://openrouter.ai/api/v1"
+
+# Persistent loop for the sync wrapper: asyncio.run per call would build
+# and tear down a fresh event loop (and the HTTP connection pool with it)
+# on every synchronous request
+_sync_loop: Optional[asyncio.AbstractEventLoop] = None
+_sync_loop_lock = threading.Lock()
+
+
+def _get_sync_loop() -> asyncio.AbstractEventLoop:
+    """Return the shared background event loop, starting it on first use"""
+    global _sync_loop
+    with _sync_loop_lock:
+        if _sync_loop is None:
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(
+                target=loop.run_forever, name="llm-client-sync", daemon=True
+            )
+            thread.start()
+            _sync_loop = loop
+    return _sync_loop
+
 
 class LLMClient:
     """
@@ -23,6 +58,7 @@ class LLMClient:
         api_key: Optional[str] = None,
         provider: str = "openrouter",
         model: str = None,
+        cache_responses: Optional[bool] = None,
     ):
         self.api_key = api_key or os.getenv("OPENROUTER_API_KEY")
         if not self.api_key:
@@ -35,11 +71,34 @@ class LLMClient:
         self.model = model or os.getenv("OPENROUTER_MODEL_DEFAULT", "x-ai/grok-4-fast")
         self.logger = logging.getLogger("llm_client")
 
-        # Initialize OpenAI client with OpenRouter base URL
-        self.client = AsyncOpenAI(
-            api_key=self.api_key,
-            base_url="https://openrouter.ai/api/v1",
-        )
+        # Cache is off by default so workflow agents always hit the API;
+        # test scripts enable it explicitly or via the environment
+        if cache_responses is None:
+            cache_responses = os.getenv("AICOE_LLM_CACHE") == "1"
+        self.cache_enabled = cache_responses
+        self._cache: "OrderedDict[str, str]" = OrderedDict()
+        self.cache_stats = {"hits": 0, "misses": 0}
+
+        # Initialize OpenAI client with OpenRouter base URL. Prefer the
+        # aiohttp transport: it schedules concurrent requests markedly
+        # better than the default httpx one, which matters once callers
+        # gather several completions at a time. Fall back to httpx when
+        # the aiohttp extra isn't installed.
+        http_client = None
+        try:
+            from openai import DefaultAioHttpClient
+
+            http_client = DefaultAioHttpClient()
+        except (ImportError, RuntimeError) as e:
+            self.logger.debug(f"aiohttp transport unavailable, using httpx: {e}")
+
+        client_kwargs = {
+            "api_key": self.api_key,
+            "base_url": _OPENROUTER_BASE_URL,
+        }
+        if http_client is not None:
+            client_kwargs["http_client"] = http_client
+        self.client = AsyncOpenAI(**client_kwargs)
 
         # Load agent-specific models from environment variables (OpenRouter model ids)
         self.agent_models = {
@@ -69,6 +128,54 @@ class LLMClient:
             "transcript": os.getenv("TRANSCRIPT_AGENT_MODEL", os.getenv("OPENROUTER_MODEL_DEFAULT", "x-ai/grok-4-fast")),
         }
 
+    def _cache_key(self, model: str, messages: list, temperature: float, max_tokens: int) -> str:
+        """Stable SHA-256 over the full request payload.
+
+        The key includes a digest of the API key and endpoint so the
+        persistent on-disk cache never answers for credentials it was
+        not written under — a hit must not mask a rotated or invalid key.
+        """
+        auth_digest = hashlib.sha256(
+            f"{self.api_key}:{_OPENROUTER_BASE_URL}".encode("utf-8")
+        ).hexdigest()
+        payload = json.dumps(
+            {
+                "auth": auth_digest,
+                "model": model,
+                "messages": messages,
+                "temperature": temperature,
+                "max_tokens": max_tokens,
+            },
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    async def _cache_get(self, key: str) -> Optional[str]:
+        """Look up a cached response: in-process LRU first, then disk"""
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key]
+        cache_file = _CACHE_DIR / key
+        try:
+            text = await asyncio.to_thread(cache_file.read_text, "utf-8")
+        except (OSError, ValueError):
+            return None
+        self._cache[key] = text
+        return text
+
+    async def _cache_put(self, key: str, response_text: str):
+        """Store a response in the LRU and best-effort on disk"""
+        self._cache[key] = response_text
+        while len(self._cache) > _CACHE_MAX_ENTRIES:
+            self._cache.popitem(last=False)
+        try:
+            await asyncio.to_thread(_CACHE_DIR.mkdir, exist_ok=True)
+            await asyncio.to_thread(
+                (_CACHE_DIR / key).write_text, response_text, "utf-8"
+            )
+        except OSError as e:
+            self.logger.debug(f"Cache write skipped: {e}")
+
     async def send_message_async(
         self,
         user_message: str,
@@ -127,6 +234,22 @@ class LLMClient:
                 f"🔵 API CALL START | Model: {self.provider}/{model_to_use} | Agent: {agent_name or 'default'}"
             )
 
+            # Low-temperature prompts are effectively deterministic — serve
+            # repeats from cache instead of re-spending tokens
+            cache_key = None
+            if self.cache_enabled and temperature <= _CACHE_TEMPERATURE_MAX:
+                cache_key = self._cache_key(
+                    model_to_use, messages, temperature, effective_max_tokens
+                )
+                cached = await self._cache_get(cache_key)
+                if cached is not None:
+                    self.cache_stats["hits"] += 1
+                    self.logger.info(
+                        f"🟢 CACHE HIT | Response: {len(cached)} chars"
+                    )
+                    return cached
+                self.cache_stats["misses"] += 1
+
             # Call OpenRouter API with optional ranking headers
             response = await self.client.chat.completions.create(
                 model=model_to_use,
@@ -142,6 +265,9 @@ class LLMClient:
             # Extract response text
             response_text = response.choices[0].message.content
 
+            if cache_key is not None and response_text:
+                await self._cache_put(cache_key, response_text)
+
             # Calculate token usage if available
             usage = getattr(response, "usage", None)
             if usage:
@@ -162,6 +288,16 @@ class LLMClient:
             self.logger.error(f"🔴 API CALL FAILED | Error: {str(e)}")
             raise Exception(f"LLM call failed: {str(e)}")
 
+    async def close(self):
+        """
+        Close the underlying HTTP client and its connection pool.
+
+        One AsyncOpenAI client (and thus one pooled HTTP session) lives for
+        the lifetime of this LLMClient, so all calls share keep-alive
+        connections; call this when done to release them cleanly.
+        """
+        await self.client.close()
+
     def set_current_agent(self, agent_name: str):
         """
         Set the current agent name to use agent-specific model
@@ -178,13 +314,20 @@ class LLMClient:
     ) -> str:
         """
         Synchronous wrapper for send_message_async
+
+        Runs on a long-lived background loop so repeated sync calls keep
+        the connection pool and DNS cache warm instead of rebuilding a
+        loop per call. Use either this or the async API for a given
+        client, not both interleaved.
         """
-        return asyncio.run(
+        future = asyncio.run_coroutine_threadsafe(
             self.send_message_async(
                 user_message=user_message,
                 system_message=system_message,
                 session_id=session_id,
                 temperature=temperature,
                 max_tokens=max_tokens,
-            )
+            ),
+            _get_sync_loop(),
         )
+        return future.result()
@@ -310,12 +310,42 @@ async def websocket_endpoint(websocket: WebSocket, workflow_id: str):
         )
 
 
+# Progress batching: coalesce bursts of small progress frames into one
+# WebSocket frame to cut per-frame WS/TCP overhead and client wakeups
+PROGRESS_BATCH_MAX = 16
+PROGRESS_BATCH_WINDOW = 0.05  # seconds
+
+
 # Function to execute workflow with progress updates
 async def execute_workflow(workflow_id: str, project_name: str, transcript: str):
     """Execute the workflow and send real-time updates via WebSocket"""
 
+    progress_buffer = []
+    flush_task = None
+
+    async def flush_progress():
+        """Send buffered progress records as a single batch frame"""
+        nonlocal flush_task
+        flush_task = None
+        if not progress_buffer or workflow_id not in active_workflows:
+            progress_buffer.clear()
+            return
+        items = list(progress_buffer)
+        progress_buffer.clear()
+        try:
+            ws = active_workflows[workflow_id]["ws"]
+            await ws.send_json({"type": "batch", "items": items})
+            print(f"Sent progress batch: {len(items)} update(s)")
+        except Exception as e:
+            print(f"Failed to send progress batch: {str(e)}")
+
+    async def delayed_flush():
+        await asyncio.sleep(PROGRESS_BATCH_WINDOW)
+        await flush_progress()
+
     async def progress_callback(progress_data):
-        """Callback to send progress updates to WebSocket"""
+        """Callback to buffer progress updates for batched WebSocket sends"""
+        nonlocal flush_task
         if workflow_id in active_workflows:
             try:
                 # Update workflow state
@@ -334,12 +364,15 @@ async def execute_workflow(workflow_id: str, project_name: str, transcript: str)
                         {"type": "progress", **progress_data}
                     )
 
-                # Send to WebSocket
-                ws = active_workflows[workflow_id]["ws"]
-                await ws.send_json({"type": "progress", **progress_data})
-                print(
-                    f"Sent progress update: {progress_data.get('stage')} - {progress_data.get('status')}"
-                )
+                # Buffer for the WebSocket; flush when full or after the
+                # batching window elapses
+                progress_buffer.append({"type": "progress", **progress_data})
+                if len(progress_buffer) >= PROGRESS_BATCH_MAX:
+                    if flush_task is not None:
+                        flush_task.cancel()
+                    await flush_progress()
+                elif flush_task is None:
+                    flush_task = asyncio.create_task(delayed_flush())
             except Exception as e:
                 print(f"Failed to send progress update: {str(e)}")
 
@@ -357,8 +390,11 @@ async def execute_workflow(workflow_id: str, project_name: str, transcript: str)
         workflow_states[workflow_id]["status"] = "completed"
         workflow_states[workflow_id]["results"] = result
 
-        # Send completion message
+        # Send completion message (flushing any buffered progress first)
         if workflow_id in active_workflows:
+            if flush_task is not None:
+                flush_task.cancel()
+            await flush_progress()
             ws = active_workflows[workflow_id]["ws"]
             await ws.send_json(
                 {
@@ -381,9 +417,12 @@ async def execute_workflow(workflow_id: str, project_name: str, transcript: str)
         # Update workflow state
         workflow_states[workflow_id]["status"] = "failed"
 
-        # Send error message
+        # Send error message (flushing any buffered progress first)
         if workflow_id in active_workflows:
             try:
+                if flush_task is not None:
+                    flush_task.cancel()
+                await flush_progress()
                 ws = active_workflows[workflow_id]["ws"]
                 await ws.send_json(
                     {"type": "error", "message": f"Workflow failed: {str(e)}"}
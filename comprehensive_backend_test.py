@@ -0,0 +1,453 @@
+#!/usr/bin/env python3
+"""
+AICOE Automation Platform - Comprehensive Backend Testing
+Exercises the API, the full WebSocket workflow with a messy real-world
+transcript, artifact generation and the backend logs in one run
+"""
+
+import asyncio
+import re
+import sys
+import time
+from collections import Counter, deque
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import aiohttp
+import orjson
+import uvloop
+
+TEST_TRANSCRIPT_FILE = Path(__file__).parent / "test_messy_transcript.txt"
+BACKEND_LOG_FILE = Path(__file__).parent / "logs" / "backend.log"
+RESULTS_FILE = Path(__file__).parent / "comprehensive_test_results.json"
+
+WORKFLOW_TIMEOUT = 1800  # 30 minutes for the full 13-agent workflow
+RECV_TIMEOUT = 120  # per-message timeout while agents are working
+
+ERROR_PATTERNS = [
+    "ERROR",
+    "CRITICAL",
+    "Exception",
+    "Traceback",
+    "Failed",
+    "timeout",
+    "connection refused",
+]
+# One compiled alternation = a single O(n) scan over the log tail instead
+# of one substring pass per pattern
+_ERROR_PATTERN_RE = re.compile(
+    "|".join(re.escape(p) for p in ERROR_PATTERNS), re.IGNORECASE
+)
+
+
+class ComprehensiveBackendTester:
+    """Runs the comprehensive backend test suite against a running stack"""
+
+    def __init__(self, base_url: str):
+        self.base_url = base_url.rstrip("/")
+        self.ws_url = self.base_url.replace("https://", "wss://").replace(
+            "http://", "ws://"
+        )
+        self.session: Optional[aiohttp.ClientSession] = None
+        self.workflow_id = f"comprehensive_test_{int(time.time())}"
+        self.project_name = f"Comprehensive Test {int(time.time())}"
+        # Bounded debug buffer plus O(1) per-type counters; keeps memory
+        # flat however long the workflow streams
+        self.websocket_messages = deque(maxlen=1024)
+        self._msg_type_counts = Counter()
+        self.completed_agents = []  # ordered, for reporting
+        self._completed_set = set()  # O(1) membership checks per frame
+        self.agent_start_times = {}  # stage -> monotonic start
+        self.agent_durations = {}
+        self.final_results: Optional[Dict[str, Any]] = None
+        self.tests_run = 0
+        self.tests_passed = 0
+        self.test_results = []
+        # One wallclock anchor; per-result stamps are cheap monotonic ns
+        # converted to ISO timestamps only when the report is written
+        self._t0_wall = time.time()
+        self._t0_mono = time.monotonic_ns()
+        self._transcript: Optional[str] = None
+        self._start_frame: Optional[str] = None
+        self._log_buf = []
+        self._idle_timed_out = False
+        # One dict lookup per frame instead of a chain of type comparisons
+        self._handlers = {
+            "progress": self._on_progress,
+            "complete": self._on_complete,
+            "error": self._on_error,
+        }
+
+    async def __aenter__(self):
+        # Bounded keep-alive pool with DNS caching shared by every API
+        # call in the run
+        connector = aiohttp.TCPConnector(
+            limit=32,
+            ttl_dns_cache=300,
+            keepalive_timeout=60,
+        )
+        self.session = aiohttp.ClientSession(connector=connector)
+        # Read the transcript once, off the event loop; every later use is
+        # a plain attribute lookup
+        self._transcript = (
+            await asyncio.to_thread(TEST_TRANSCRIPT_FILE.read_text, "utf-8")
+        ).strip()
+        # Serialize the start frame once; it embeds the whole transcript,
+        # so re-encoding per (re)connect would copy kilobytes each time.
+        # Kept as str because the server reads text-mode frames.
+        self._start_frame = orjson.dumps({
+            "action": "start",
+            "project_name": self.project_name,
+            "transcript": self._transcript,
+        }).decode()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        if self.session:
+            await self.session.close()
+
+    def _log_progress(self, line: str, flush_every: int = 50):
+        """Buffer progress lines so the recv loop isn't stalled by stdout"""
+        self._log_buf.append(line + "\n")
+        if len(self._log_buf) >= flush_every:
+            self._flush_progress_log()
+
+    def _flush_progress_log(self):
+        if self._log_buf:
+            sys.stdout.writelines(self._log_buf)
+            sys.stdout.flush()
+            self._log_buf.clear()
+
+    def log_test(self, name: str, success: bool, details: str = ""):
+        """Log test result"""
+        self._flush_progress_log()  # keep buffered progress ahead of results
+        self.tests_run += 1
+        if success:
+            self.tests_passed += 1
+            print(f"✅ {name}: PASSED")
+        else:
+            print(f"❌ {name}: FAILED - {details}")
+
+        self.test_results.append({
+            "name": name,
+            "success": success,
+            "details": details,
+            "t_mono": time.monotonic_ns(),
+        })
+
+    async def load_messy_transcript(self) -> str:
+        """Return the messy real-world transcript (cached at __aenter__)"""
+        return self._transcript
+
+    async def test_health(self) -> bool:
+        """Verify the backend is reachable"""
+        print("\n🔍 Checking Backend Health...")
+        try:
+            async with self.session.get(
+                f"{self.base_url}/health", timeout=aiohttp.ClientTimeout(total=10)
+            ) as response:
+                # Drain the (tiny) body so the connection goes back to the
+                # keep-alive pool instead of being closed with bytes pending
+                await response.read()
+                success = response.status == 200
+                self.log_test("Backend Health", success, f"Status: {response.status}")
+                return success
+        except Exception as e:
+            self.log_test("Backend Health", False, str(e))
+            return False
+
+    async def initiate_workflow(self) -> bool:
+        """Create the project record the workflow will populate"""
+        print("\n🔍 Initiating Workflow...")
+        transcript = await self.load_messy_transcript()
+        try:
+            async with self.session.post(
+                f"{self.base_url}/api/projects/create",
+                json={
+                    "project_name": self.project_name,
+                    "description": "Comprehensive backend test project",
+                    "requirements": transcript[:500],
+                    "industry": "Technology",
+                },
+                timeout=aiohttp.ClientTimeout(total=30),
+            ) as response:
+                await response.read()  # drain for keep-alive reuse
+                success = response.status == 200
+                self.log_test("Initiate Workflow", success,
+                              f"Status: {response.status}")
+                return success
+        except Exception as e:
+            self.log_test("Initiate Workflow", False, str(e))
+            return False
+
+    def _on_progress(self, data: Dict[str, Any],
+                     start_time: float) -> Optional[bool]:
+        stage = data.get("stage")
+        status = data.get("status")
+        if status == "running" and stage not in self.agent_start_times:
+            self.agent_start_times[stage] = time.monotonic()
+        if status == "completed" and stage not in self._completed_set:
+            self._completed_set.add(stage)
+            self.completed_agents.append(stage)
+            started = self.agent_start_times.get(stage)
+            if started:
+                self.agent_durations[stage] = time.monotonic() - started
+        self._log_progress(f"  📊 {stage}: {status} - {data.get('message', '')}")
+        return None
+
+    def _on_complete(self, data: Dict[str, Any],
+                     start_time: float) -> Optional[bool]:
+        self.final_results = data.get("results") or {}
+        self.log_test(
+            "Workflow Monitoring", True,
+            f"Completed {len(self.completed_agents)} agents, "
+            f"{sum(self._msg_type_counts.values())} messages in "
+            f"{time.monotonic() - start_time:.0f}s"
+        )
+        return True
+
+    def _on_error(self, data: Dict[str, Any],
+                  start_time: float) -> Optional[bool]:
+        self.log_test(
+            "Workflow Monitoring", False, data.get("message", "Unknown error")
+        )
+        return False
+
+    def _process_message(self, data: Dict[str, Any],
+                         start_time: float) -> Optional[bool]:
+        """Handle one workflow message; returns the outcome when terminal"""
+        self.websocket_messages.append(data)
+        message_type = data.get("type")
+        self._msg_type_counts[message_type or "unknown"] += 1
+
+        handler = self._handlers.get(message_type)
+        if handler is None:
+            return None
+        return handler(data, start_time)
+
+    async def monitor_websocket_workflow(self) -> bool:
+        """Run the workflow over WebSocket, recording every message"""
+        print("\n🔍 Monitoring Workflow via WebSocket...")
+        ws_endpoint = f"{self.ws_url}/api/ws/{self.workflow_id}"
+
+        try:
+            # Reuse the existing aiohttp session for the WebSocket too: one
+            # protocol stack, pooled connection, and a C frame parser.
+            # compress=0 skips permessage-deflate and max_msg_size leaves
+            # room for the large final results frame.
+            async with self.session.ws_connect(
+                ws_endpoint,
+                compress=0,
+                max_msg_size=2**22,
+                heartbeat=30,
+            ) as websocket:
+                print(f"Connected to WebSocket: {ws_endpoint}")
+
+                await websocket.send_str(self._start_frame)
+
+                start_time = time.monotonic()
+                self._idle_timed_out = False
+                try:
+                    return await asyncio.wait_for(
+                        self._consume_messages(websocket, start_time),
+                        timeout=WORKFLOW_TIMEOUT,
+                    )
+                except asyncio.TimeoutError:
+                    self.log_test("Workflow Monitoring", False,
+                                  f"Timed out after {WORKFLOW_TIMEOUT}s")
+                    return False
+                except asyncio.CancelledError:
+                    if not self._idle_timed_out:
+                        raise
+                    self.log_test(
+                        "Workflow Monitoring", False,
+                        f"No message for {RECV_TIMEOUT}s "
+                        f"(completed: {', '.join(self.completed_agents)})"
+                    )
+                    return False
+                finally:
+                    self._flush_progress_log()
+        except Exception as e:
+            self.log_test("Workflow Monitoring", False, str(e))
+            return False
+
+    async def _consume_messages(self, websocket, start_time: float) -> bool:
+        """Receive loop with a single reschedulable idle timer.
+
+        Wrapping every receive() in asyncio.wait_for allocates and cancels
+        a TimerHandle per frame; one call_later handle rescheduled on each
+        message does the same job for hundreds of frames.
+        """
+        loop = asyncio.get_running_loop()
+        task = asyncio.current_task()
+
+        def on_idle():
+            self._idle_timed_out = True
+            task.cancel()
+
+        idle_timer = loop.call_later(RECV_TIMEOUT, on_idle)
+        try:
+            while True:
+                msg = await websocket.receive()
+                idle_timer.cancel()
+                idle_timer = loop.call_later(RECV_TIMEOUT, on_idle)
+
+                if msg.type in (
+                    aiohttp.WSMsgType.CLOSE,
+                    aiohttp.WSMsgType.CLOSED,
+                    aiohttp.WSMsgType.ERROR,
+                ):
+                    self.log_test(
+                        "Workflow Monitoring", False,
+                        f"WebSocket closed: {msg.type.name}"
+                    )
+                    return False
+                if msg.type not in (
+                    aiohttp.WSMsgType.TEXT,
+                    aiohttp.WSMsgType.BINARY,
+                ):
+                    continue
+
+                # orjson.loads takes str or bytes alike; accepting BINARY
+                # frames means a server that sends raw bytes skips the
+                # per-frame UTF-8 decode+validate entirely
+                data = orjson.loads(msg.data)
+                # The server coalesces bursts of progress updates into
+                # one {"type": "batch", "items": [...]} frame
+                if data.get("type") == "batch":
+                    items = data.get("items", [])
+                else:
+                    items = [data]
+
+                for item in items:
+                    done = self._process_message(item, start_time)
+                    if done is not None:
+                        return done
+        finally:
+            idle_timer.cancel()
+
+    async def verify_artifact_generation(self):
+        """Verify each expected agent produced output in the final results"""
+        print("\n🔍 Verifying Artifact Generation...")
+        results = self.final_results
+        if results is None:
+            try:
+                async with self.session.get(
+                    f"{self.base_url}/api/workflow/{self.workflow_id}/status",
+                    timeout=aiohttp.ClientTimeout(total=10),
+                ) as response:
+                    data = await response.json()
+                    results = data.get("results") or {}
+            except Exception as e:
+                self.log_test("Artifact Generation", False, str(e))
+                return
+
+        generated = [agent for agent in self.completed_agents if agent in results]
+        missing = [agent for agent in self.completed_agents if agent not in results]
+        success = len(missing) == 0 and len(generated) > 0
+        details = f"Artifacts for {len(generated)} agents"
+        if missing:
+            details += f", missing: {', '.join(missing)}"
+        self.log_test("Artifact Generation", success, details)
+
+    @staticmethod
+    def _read_log_tail(path: Path, tail_bytes: int = 8192) -> str:
+        """Read the last tail_bytes of a log without spawning tail(1)"""
+        with open(path, "rb") as f:
+            f.seek(0, 2)
+            size = f.tell()
+            f.seek(max(0, size - tail_bytes))
+            return f.read().decode("utf-8", "replace")
+
+    async def check_backend_logs(self):
+        """Scan the tail of the backend log for error patterns"""
+        print("\n🔍 Checking Backend Logs...")
+        try:
+            tail = await asyncio.to_thread(self._read_log_tail, BACKEND_LOG_FILE)
+            # Short-circuit the clean (common) case with a single scan;
+            # only enumerate the individual hits when the check fails
+            if _ERROR_PATTERN_RE.search(tail) is None:
+                self.log_test("Backend Logs", True, "Clean")
+            else:
+                hits = sorted(
+                    {m.group(0) for m in _ERROR_PATTERN_RE.finditer(tail)}
+                )
+                self.log_test(
+                    "Backend Logs", False,
+                    f"Error patterns found: {', '.join(hits)}"
+                )
+        except Exception as e:
+            self.log_test("Backend Logs", False, str(e))
+
+    async def save_results(self):
+        """Write the detailed results report"""
+        # Materialize ISO timestamps from the monotonic stamps now, once
+        for result in self.test_results:
+            t_mono = result.pop("t_mono", None)
+            if t_mono is not None:
+                wall = self._t0_wall + (t_mono - self._t0_mono) / 1e9
+                result["timestamp"] = datetime.fromtimestamp(wall).isoformat()
+        detailed_results = {
+            "workflow_id": self.workflow_id,
+            "project_name": self.project_name,
+            "tests_run": self.tests_run,
+            "tests_passed": self.tests_passed,
+            "completed_agents": self.completed_agents,
+            "agent_durations": self.agent_durations,
+            "websocket_message_count": sum(self._msg_type_counts.values()),
+            "websocket_message_types": dict(self._msg_type_counts),
+            "recent_websocket_messages": list(self.websocket_messages),
+            "results": self.test_results,
+        }
+        payload = orjson.dumps(
+            detailed_results, default=str, option=orjson.OPT_INDENT_2
+        )
+        await asyncio.to_thread(RESULTS_FILE.write_bytes, payload)
+        print(f"\n💾 Results saved to {RESULTS_FILE}")
+
+    async def run_comprehensive_test(self):
+        """Run the comprehensive test suite"""
+        print("🚀 Starting AICOE Comprehensive Backend Test")
+        print(f"📍 Testing endpoint: {self.base_url}")
+        print("=" * 60)
+
+        if not await self.test_health():
+            print("\n❌ Backend not reachable, aborting")
+            return self.tests_passed, self.tests_run
+
+        await self.initiate_workflow()
+
+        if await self.monitor_websocket_workflow():
+            await self.verify_artifact_generation()
+
+        await self.check_backend_logs()
+
+        print("\n" + "=" * 60)
+        print("📊 TEST SUMMARY")
+        print("=" * 60)
+        print(f"Total Tests: {self.tests_run}")
+        print(f"Passed: {self.tests_passed}")
+        print(f"Failed: {self.tests_run - self.tests_passed}")
+        print(f"Agents Completed: {', '.join(self.completed_agents) or 'none'}")
+        for stage, duration in self.agent_durations.items():
+            print(f"  ⏱️  {stage}: {duration:.1f}s")
+
+        await self.save_results()
+        return self.tests_passed, self.tests_run
+
+
+async def main():
+    import os
+
+    base_url = os.getenv("BACKEND_URL", "http://localhost:8000")
+    async with ComprehensiveBackendTester(base_url) as tester:
+        passed, total = await tester.run_comprehensive_test()
+    return 0 if passed == total else 1
+
+
+if __name__ == "__main__":
+    # uvloop's libuv-based loop is a drop-in replacement that dispatches
+    # socket reads noticeably faster than the default selector loop
+    uvloop.install()
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+AICOE Automation Platform - OpenRouter Integration Test
+Exercises the LLMClient against the live OpenRouter API: connection check,
+different message types, error scenarios and the synchronous wrapper
+"""
+
+import asyncio
+import json
+import re
+import sys
+
+sys.path.insert(0, "backend")
+
+from agents.llm_client import LLMClient  # noqa: E402
+
+# One compiled alternation covers every auth-failure string OpenRouter is
+# known to return — a single DFA scan instead of chained substring probes
+AUTH_ERR_RE = re.compile(
+    r"API Key Invalid|Authentication|invalid_api_key|Unauthorized"
+    r"|No auth credentials|401",
+    re.IGNORECASE,
+)
+
+
+def is_auth_error(exc: BaseException) -> bool:
+    """True when the exception looks like an API-key/authentication failure"""
+    return AUTH_ERR_RE.search(str(exc)) is not None
+
+
+async def test_connection_status(client: LLMClient) -> bool:
+    """Quick round-trip to confirm the API key and endpoint work"""
+    print("🔍 Testing connection status...")
+    try:
+        response = await client.send_message_async(
+            "Say 'OpenRouter connection OK' if you can read this.",
+            temperature=0.1,
+            max_tokens=20,
+        )
+        print(f"  💬 {response.strip()}")
+        print("✅ Connection status: OK")
+        return True
+    except Exception as e:
+        print(f"❌ Connection status: FAILED - {str(e)}")
+        return False
+
+
+async def test_different_message_types(client: LLMClient) -> bool:
+    """Send math, creative, JSON and code prompts through the same client"""
+    print("\n🔍 Testing different message types...")
+    # The combined output is small (~300 tokens), so one structured-output
+    # call beats four parallel ones: a single prefill pass and one HTTP
+    # round-trip cover math, creative, JSON and code in the same response
+    try:
+        response = await client.send_message_async(
+            "Complete these four tasks:\n"
+            "1. math: What is 17 * 23? Just the number.\n"
+            "2. poem: A two-line poem about automation.\n"
+            '3. json_obj: An object with keys "name" and "status" describing '
+            "a fictional project.\n"
+            "4. code: A one-line Python lambda that doubles a number, as a "
+            "string.",
+            system_message=(
+                "Return a single JSON object with exactly the keys math, "
+                "poem, json_obj and code containing the answers to the four "
+                "tasks below. Reply with JSON only, no markdown fences."
+            ),
+            temperature=0.2,
+            max_tokens=300,
+        )
+
+        text = response.strip()
+        if text.startswith("```"):
+            text = text.strip("`").lstrip("json").strip()
+        answers = json.loads(text)
+
+        passed = True
+        for key, label, emoji in (
+            ("math", "Math", "🧮"),
+            ("poem", "Poem", "✍️"),
+            ("json_obj", "JSON", "📋"),
+            ("code", "Code", "💻"),
+        ):
+            if key in answers:
+                print(f"  {emoji} {label}: {str(answers[key])[:80]}")
+            else:
+                print(f"  ❌ {label}: key '{key}' missing from response")
+                passed = False
+    except json.JSONDecodeError as e:
+        print(f"  ❌ Response was not valid JSON: {str(e)}")
+        passed = False
+    except Exception as e:
+        print(f"❌ Different message types: FAILED - {str(e)}")
+        return False
+
+    if passed:
+        print("✅ Different message types: OK")
+    else:
+        print("❌ Different message types: FAILED")
+    return passed
+
+
+async def _invalid_key_probe() -> str:
+    """Attempt a call with a bogus key on its own throwaway client"""
+    # Must never share the pooled session — a 401 here should not disturb
+    # the shared client's connections
+    bad_client = LLMClient(api_key="sk-or-v1-invalid-key-for-testing")
+    try:
+        return await bad_client.send_message_async(
+            "This should fail.", temperature=0.1, max_tokens=20
+        )
+    finally:
+        await bad_client.close()
+
+
+async def test_error_scenarios(client: LLMClient) -> bool:
+    """Probe empty messages, very long messages and an invalid API key"""
+    print("\n🔍 Testing error scenarios...")
+    passed = True
+
+    # The three probes are independent round-trips; run them as one wave.
+    # The invalid-key probe's 401 turnaround often dominates, so it no
+    # longer adds its latency on top of the other two.
+    long_message = "Summarize this: " + ("data " * 2000)
+    empty_result, long_result, invalid_result = await asyncio.gather(
+        client.send_message_async("", temperature=0.1, max_tokens=20),
+        client.send_message_async(long_message, temperature=0.1, max_tokens=50),
+        _invalid_key_probe(),
+        return_exceptions=True,
+    )
+
+    # Empty message — the API may answer or reject; either is acceptable
+    if isinstance(empty_result, Exception):
+        print(f"  📭 Empty message rejected: {str(empty_result)[:100]}")
+    else:
+        print(f"  📭 Empty message accepted ({len(empty_result)} chars)")
+
+    # Very long message — should either succeed or fail with a clear error
+    if isinstance(long_result, Exception):
+        print(f"  📜 Long message rejected: {str(long_result)[:100]}")
+    else:
+        print(f"  📜 Long message handled ({len(long_result)} chars)")
+
+    # Invalid key — only an authentication-style failure counts as correct
+    if isinstance(invalid_result, Exception):
+        if is_auth_error(invalid_result):
+            print("  🔑 Invalid key correctly rejected")
+        else:
+            print(f"  🔑 Invalid key failed with: {str(invalid_result)[:100]}")
+    else:
+        print("  ⚠️ Invalid key was accepted - unexpected")
+        passed = False
+
+    if passed:
+        print("✅ Error scenarios: OK")
+    else:
+        print("❌ Error scenarios: FAILED")
+    return passed
+
+
+def test_synchronous_methods(client: LLMClient) -> bool:
+    """Exercise the blocking send_message wrapper"""
+    print("\n🔍 Testing synchronous methods...")
+    try:
+        response = client.send_message(
+            "Say 'sync OK' if you can read this.", temperature=0.1, max_tokens=20
+        )
+        print(f"  💬 {response.strip()}")
+        print("✅ Synchronous methods: OK")
+        return True
+    except Exception as e:
+        print(f"❌ Synchronous methods: FAILED - {str(e)}")
+        return False
+
+
+async def main():
+    print("🚀 OpenRouter Integration Test")
+    print("=" * 60)
+
+    # One shared client for the whole suite: its pooled HTTP session keeps
+    # connections alive across all calls instead of paying a fresh TLS
+    # handshake per test. The response cache makes repeat CI runs of the
+    # deterministic (low-temperature) prompts free
+    client = LLMClient(cache_responses=True)
+    sync_client = None
+    results = {}
+    try:
+        # Connection check is the gate: if the key or endpoint is broken
+        # there is no point firing the rest of the suite
+        results["connection_status"] = await test_connection_status(client)
+        if results["connection_status"]:
+            # The remaining suites are independent, so they run as one
+            # concurrent wave; the sync wrapper goes through to_thread
+            # (with its own client) so its blocking .result() call never
+            # stalls this event loop
+            sync_client = LLMClient()
+            (
+                results["message_types"],
+                results["error_scenarios"],
+                results["synchronous_methods"],
+            ) = await asyncio.gather(
+                test_different_message_types(client),
+                test_error_scenarios(client),
+                asyncio.to_thread(test_synchronous_methods, sync_client),
+            )
+        else:
+            print("⏭️ Skipping remaining suites — connection check failed")
+            results["message_types"] = False
+            results["error_scenarios"] = False
+            results["synchronous_methods"] = False
+    finally:
+        await client.close()
+        if sync_client is not None:
+            await sync_client.close()
+
+    print("\n" + "=" * 60)
+    print("📊 SUMMARY")
+    passed = sum(1 for ok in results.values() if ok)
+    for name, ok in results.items():
+        print(f"  {'✅' if ok else '❌'} {name}")
+    stats = client.cache_stats
+    print(f"  💾 LLM cache: {stats['hits']} hits / {stats['misses']} misses")
+    print(f"\n{passed}/{len(results)} test suites passed")
+    return passed == len(results)
+
+
+if __name__ == "__main__":
+    success = asyncio.run(main())
+    sys.exit(0 if success else 1)
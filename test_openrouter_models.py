@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+AICOE Automation Platform - OpenRouter Model Probe
+Finds a working OpenRouter model for this API key by probing a shortlist
+of candidates and reporting the first one that answers
+"""
+
+import asyncio
+import os
+import sys
+
+import httpx
+from openai import AsyncOpenAI
+
+MODELS_TO_TEST = [
+    os.getenv("OPENROUTER_MODEL_DEFAULT", "x-ai/grok-4-fast"),
+    "openai/gpt-4o-mini",
+    "google/gemini-2.0-flash-001",
+    "meta-llama/llama-3.3-70b-instruct",
+]
+
+
+async def _probe(client: AsyncOpenAI, model: str) -> tuple:
+    """Send one tiny completion through `model`; raise on any failure"""
+    response = await client.chat.completions.create(
+        model=model,
+        messages=[{"role": "user", "content": "Reply with the word 'ok'."}],
+        temperature=0.1,
+        max_tokens=10,
+    )
+    return model, response.choices[0].message.content
+
+
+async def test_openrouter_models():
+    """Probe all candidate models concurrently, return the first success"""
+    print("🚀 OpenRouter Model Probe")
+    print("=" * 60)
+
+    api_key = os.getenv("OPENROUTER_API_KEY")
+    if not api_key:
+        print("❌ OPENROUTER_API_KEY not set")
+        return None
+
+    # One shared client: every probe reuses the same pooled connection
+    # instead of opening a fresh TLS session per model. The pool is sized
+    # to the probe count so all of them keep a warm connection alive.
+    client = AsyncOpenAI(
+        api_key=api_key,
+        base_url="https://openrouter.ai/api/v1",
+        http_client=httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=len(MODELS_TO_TEST),
+                max_keepalive_connections=len(MODELS_TO_TEST),
+            ),
+            timeout=30.0,
+        ),
+    )
+
+    winner = None
+    try:
+        # All probes are in flight at once; the loop below takes whichever
+        # finishes first, so latency is max(one probe) rather than the sum
+        tasks = [
+            asyncio.create_task(_probe(client, model)) for model in MODELS_TO_TEST
+        ]
+        print(f"🔍 Probing {len(tasks)} models concurrently...")
+
+        for coro in asyncio.as_completed(tasks):
+            try:
+                model, reply = await coro
+                print(f"✅ {model} responded: {reply.strip()}")
+                winner = model
+                break
+            except Exception as e:
+                print(f"❌ Probe failed: {str(e)[:100]}")
+
+        # First success wins; the slower probes are no longer needed
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+    finally:
+        await client.close()
+
+    if winner:
+        print(f"\n📊 Working model: {winner}")
+    else:
+        print("\n📊 No candidate model responded")
+    return winner
+
+
+if __name__ == "__main__":
+    result = asyncio.run(test_openrouter_models())
+    sys.exit(0 if result else 1)
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+AICOE Automation Platform - WebSocket Workflow Test
+Drives the /api/ws/{workflow_id} endpoint directly: a short-timeout smoke
+test that only verifies early progress frames, and an optional full
+workflow run
+"""
+
+import asyncio
+import os
+import uuid
+from datetime import datetime
+from pathlib import Path
+
+import aiofiles
+import aiohttp
+import orjson
+import websockets
+
+BASE_URL = "http://localhost:8000"
+WS_BASE_URL = "ws://localhost:8000"
+TEST_TRANSCRIPT_FILE = Path(__file__).parent / "test_transcript_ui_test.txt"
+
+SHORT_TIMEOUT = 60  # seconds of progress to watch in the smoke test
+FULL_TIMEOUT = 1800  # full workflow ceiling
+
+
+async def load_test_transcript() -> str:
+    """Read the UI test transcript without blocking the event loop"""
+    async with aiofiles.open(TEST_TRANSCRIPT_FILE, "r", encoding="utf-8") as f:
+        return await f.read()
+
+
+async def test_workflow_with_short_timeout(transcript: str) -> bool:
+    """Start a workflow and verify progress frames arrive within a minute"""
+    print("🔍 Short-timeout workflow test...")
+
+    # The workflow_id is client-chosen, so the websocket connect can start
+    # speculatively while the health check is in flight — the two
+    # handshakes overlap instead of paying one RTT after the other
+    workflow_id = f"ws-short-{uuid.uuid4().hex[:8]}"
+    uri = f"{WS_BASE_URL}/api/ws/{workflow_id}"
+    # ensure_future, not create_task: websockets' connect() is an awaitable
+    # object rather than a coroutine, which create_task rejects
+    connect_task = asyncio.ensure_future(websockets.connect(uri))
+
+    try:
+        async with aiohttp.ClientSession() as session:
+            async with session.get(f"{BASE_URL}/health") as response:
+                if response.status != 200:
+                    print(f"❌ Backend health check failed: HTTP {response.status}")
+                    connect_task.cancel()
+                    await asyncio.gather(connect_task, return_exceptions=True)
+                    return False
+                await response.read()  # drain for keep-alive reuse
+    except Exception as e:
+        print(f"❌ Backend health check failed: {str(e)}")
+        connect_task.cancel()
+        await asyncio.gather(connect_task, return_exceptions=True)
+        return False
+
+    try:
+        websocket = await connect_task
+    except Exception as e:
+        print(f"❌ WebSocket connect failed: {str(e)}")
+        return False
+
+    try:
+        async with websocket:
+            start_message = {
+                "action": "start",
+                "project_name": f"WS Short Test {datetime.now().strftime('%H%M%S')}",
+                "transcript": transcript,
+            }
+            # orjson serializes in C; decode to str because the server
+            # reads the start frame in text mode
+            await websocket.send(orjson.dumps(start_message).decode())
+            print(f"  🚀 Workflow started: {workflow_id}")
+
+            progress_count = 0
+            deadline = asyncio.get_event_loop().time() + SHORT_TIMEOUT
+            while asyncio.get_event_loop().time() < deadline:
+                remaining = deadline - asyncio.get_event_loop().time()
+                try:
+                    message = await asyncio.wait_for(
+                        websocket.recv(), timeout=remaining
+                    )
+                except asyncio.TimeoutError:
+                    break
+
+                try:
+                    data = orjson.loads(message)
+                except orjson.JSONDecodeError:
+                    print(f"  ⚠️ Non-JSON frame: {message[:80]}")
+                    continue
+
+                msg_type = data.get("type")
+                if msg_type == "batch":
+                    progress_count += len(data.get("items", []))
+                elif msg_type == "progress":
+                    progress_count += 1
+                elif msg_type == "error":
+                    print(f"  ❌ Workflow error: {data.get('message')}")
+                    return False
+
+            if progress_count > 0:
+                print(f"✅ Received {progress_count} progress records in {SHORT_TIMEOUT}s")
+                return True
+            print("❌ No progress frames received before timeout")
+            return False
+    except Exception as e:
+        print(f"❌ Short-timeout test failed: {str(e)}")
+        return False
+
+
+async def test_websocket_workflow(transcript: str) -> bool:
+    """Run one full workflow over the websocket and wait for completion"""
+    print("\n🔍 Full workflow test...")
+
+    workflow_id = f"ws-full-{uuid.uuid4().hex[:8]}"
+    uri = f"{WS_BASE_URL}/api/ws/{workflow_id}"
+
+    try:
+        async with websockets.connect(uri) as websocket:
+            start_message = {
+                "action": "start",
+                "project_name": f"WS Full Test {datetime.now().strftime('%H%M%S')}",
+                "transcript": transcript,
+            }
+            await websocket.send(orjson.dumps(start_message).decode())
+            print(f"  🚀 Workflow started: {workflow_id}")
+
+            agents_seen = set()
+            deadline = asyncio.get_event_loop().time() + FULL_TIMEOUT
+            while asyncio.get_event_loop().time() < deadline:
+                remaining = deadline - asyncio.get_event_loop().time()
+                try:
+                    message = await asyncio.wait_for(
+                        websocket.recv(), timeout=min(remaining, 120)
+                    )
+                except asyncio.TimeoutError:
+                    print("  ⚠️ No frames for 120s, giving up")
+                    return False
+
+                try:
+                    data = orjson.loads(message)
+                except orjson.JSONDecodeError:
+                    continue
+
+                msg_type = data.get("type")
+                records = data.get("items", []) if msg_type == "batch" else [data]
+                for record in records:
+                    if record.get("type") == "progress":
+                        # Progress frames carry the orchestrator stage name
+                        stage = record.get("stage")
+                        if stage and stage not in agents_seen:
+                            agents_seen.add(stage)
+                            print(f"  📊 {stage}: {record.get('message', '')[:60]}")
+
+                if msg_type == "complete":
+                    print(f"✅ Workflow completed, {len(agents_seen)} agents reported")
+                    return True
+                if msg_type == "error":
+                    print(f"  ❌ Workflow error: {data.get('message')}")
+                    return False
+
+            print("❌ Workflow did not complete in time")
+            return False
+    except Exception as e:
+        print(f"❌ Full workflow test failed: {str(e)}")
+        return False
+
+
+async def main():
+    print("🚀 AICOE WebSocket Workflow Test")
+    print("=" * 60)
+
+    # Read the transcript once and hand it to both tests — no reason to
+    # reopen and re-decode the same file per test
+    transcript = await load_test_transcript()
+    print(f"📋 Loaded test transcript ({len(transcript)} chars)")
+
+    # No interactive prompt: an input() gate blocks the event loop and
+    # makes this file unusable in any parallel test runner. The full
+    # workflow run is opted into via the environment instead.
+    run_full = os.getenv("AICOE_RUN_FULL_WS_TEST") == "1"
+
+    full_result = None
+    if run_full:
+        # Each test drives its own workflow_id, so both can run at once
+        short_result, full_result = await asyncio.gather(
+            test_workflow_with_short_timeout(transcript),
+            test_websocket_workflow(transcript),
+        )
+    else:
+        short_result = await test_workflow_with_short_timeout(transcript)
+        print("⏭️ Skipping full workflow test (set AICOE_RUN_FULL_WS_TEST=1 to enable)")
+
+    print("\n" + "=" * 60)
+    print("📊 SUMMARY")
+    print(f"  {'✅' if short_result else '❌'} short timeout test")
+    if full_result is not None:
+        print(f"  {'✅' if full_result else '❌'} full workflow test")
+    return short_result and full_result is not False
+
+
+if __name__ == "__main__":
+    import sys
+
+    success = asyncio.run(main())
+    sys.exit(0 if success else 1)